@@ -1,16 +1,37 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, noload, selectinload
 
 from app.db.models import Book, Loan, Borrower
 
 
+class BookUnavailableError(ValueError):
+    pass
+
+
+async def _execute_write(session: AsyncSession, statement):
+    # single round trip for UPDATE/DELETE ... RETURNING, no read-before-write
+    try:
+        result = await session.execute(statement)
+        row = result.scalar_one_or_none()
+        await session.commit()
+    except IntegrityError:  # unique / foreign key violations are handled by the routers
+        await session.rollback()
+        raise
+    return row
+
+
 async def create_book(session: AsyncSession, serial_num: str, title: str, author: str) -> Book:
     book = Book(serial_num=serial_num, title=title, author=author)
     session.add(book)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise
     await session.refresh(book)
     return book
 
@@ -27,8 +48,13 @@ async def get_all_books(
     serial_num: int | None = None,
     title: str | None = None,
     author: str | None = None,
+    available: bool | None = None,
+    include_loans: bool = True,
 ) -> list[Book]:
-    query = select(Book).options(selectinload(Book.loans).selectinload(Loan.borrower))  # load nested objects
+    if include_loans:
+        query = select(Book).options(selectinload(Book.loans).selectinload(Loan.borrower))  # load nested objects
+    else:
+        query = select(Book).options(noload(Book.loans))  # single SELECT for summary listings
 
     if serial_num:
         query = query.where(Book.serial_num == serial_num)
@@ -36,6 +62,11 @@ async def get_all_books(
         query = query.where(Book.title.ilike(f"%{title}%"))
     if author:
         query = query.where(Book.author.ilike(f"%{author}%"))
+    if available is not None:
+        if available:
+            query = query.where(Book.is_available)
+        else:
+            query = query.where(~Book.is_available)
     if skip is not None:
         query = query.offset(skip)
     if limit is not None:
@@ -48,33 +79,34 @@ async def get_all_books(
 async def update_book(
     session: AsyncSession, book_id: int, serial_num: str = None, title: str = None, author: str = None
 ) -> Book | None:
-    book = await get_book(session, book_id)
-    if not book:
-        return None
+    values = {}
     if title:
-        book.title = title
+        values["title"] = title
     if author:
-        book.author = author
+        values["author"] = author
     if serial_num:
-        book.serial_num = serial_num
-    await session.commit()
-    await session.refresh(book)
-    return book
+        values["serial_num"] = serial_num
+    if not values:
+        return await get_book(session, book_id)
+    statement = update(Book).where(Book.id == book_id).values(**values).returning(Book)
+    # LoanRead only needs the foreign key ids, so skip the selectin load of each loan's borrower
+    statement = select(Book).from_statement(statement).options(selectinload(Book.loans).lazyload(Loan.borrower))
+    return await _execute_write(session, statement)
 
 
 async def delete_book(session: AsyncSession, book_id: int) -> bool:
-    book = await get_book(session, book_id)
-    if not book:
-        return False
-    await session.delete(book)
-    await session.commit()
-    return True
+    deleted_id = await _execute_write(session, delete(Book).where(Book.id == book_id).returning(Book.id))
+    return deleted_id is not None
 
 
 async def create_borrower(session: AsyncSession, card_number: str) -> Borrower:
     borrower = Borrower(card_number=card_number)
     session.add(borrower)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise
     await session.refresh(borrower)
     return borrower
 
@@ -103,22 +135,15 @@ async def get_all_borrowers(
 
 
 async def update_borrower(session: AsyncSession, borrower_id: int, new_card_number: str) -> Borrower | None:
-    borrower = await get_borrower(session, borrower_id)
-    if not borrower:
-        return None
-    borrower.card_number = new_card_number
-    await session.commit()
-    await session.refresh(borrower)
-    return borrower
+    statement = update(Borrower).where(Borrower.id == borrower_id).values(card_number=new_card_number).returning(Borrower)
+    # LoanRead only needs the foreign key ids, so skip the selectin load of each loan's book
+    statement = select(Borrower).from_statement(statement).options(selectinload(Borrower.loans).lazyload(Loan.book))
+    return await _execute_write(session, statement)
 
 
-async def delete_borrower(session: AsyncSession, borrower_id: id) -> bool:
-    borrower = await get_borrower(session, borrower_id)
-    if not borrower:
-        return False
-    await session.delete(borrower)
-    await session.commit()
-    return True
+async def delete_borrower(session: AsyncSession, borrower_id: int) -> bool:
+    deleted_id = await _execute_write(session, delete(Borrower).where(Borrower.id == borrower_id).returning(Borrower.id))
+    return deleted_id is not None
 
 
 async def create_loan(session: AsyncSession, book_id: int, borrower_id: int, borrow_date: datetime = None) -> Loan:
@@ -132,6 +157,17 @@ async def create_loan(session: AsyncSession, book_id: int, borrower_id: int, bor
     loan.book = book
     loan.borrower = borrower
     session.add(loan)
+    await session.flush()
+    # claim the book only if nobody else holds it, the row lock serializes concurrent checkouts
+    claimed = await session.execute(
+        update(Book)
+        .where(Book.id == book.id, Book.is_available)
+        .values(current_loan_id=loan.id)
+        .returning(Book.id)
+    )
+    if claimed.scalar_one_or_none() is None:
+        await session.rollback()
+        raise BookUnavailableError("Book is already on loan")
     await session.commit()
     await session.refresh(loan)
     return loan
@@ -170,19 +206,23 @@ async def get_all_loans(
 
 
 async def update_loan_return_date(session: AsyncSession, loan_id: int, return_date: datetime) -> Loan | None:
-    loan = await get_loan(session, loan_id)
-    if not loan:
-        return None
-    loan.return_date = return_date
+    statement = update(Loan).where(Loan.id == loan_id).values(return_date=return_date).returning(Loan)
+    # LoanRead only needs the foreign key ids, so skip the selectin loads of book and borrower
+    statement = select(Loan).from_statement(statement).options(lazyload(Loan.book), lazyload(Loan.borrower))
+    result = await session.execute(statement)
+    loan = result.scalar_one_or_none()
+    if loan:
+        # release the book in the same transaction as the return
+        await session.execute(
+            update(Book)
+            .where(Book.current_loan_id == loan_id)
+            .values(current_loan_id=None)
+            .execution_options(synchronize_session=False)
+        )
     await session.commit()
-    await session.refresh(loan)
     return loan
 
 
 async def delete_loan(session: AsyncSession, loan_id: int) -> bool:
-    loan = await get_loan(session, loan_id)
-    if not loan:
-        return False
-    await session.delete(loan)
-    await session.commit()
-    return True
\ No newline at end of file
+    deleted_id = await _execute_write(session, delete(Loan).where(Loan.id == loan_id).returning(Loan.id))
+    return deleted_id is not None
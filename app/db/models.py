@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, String
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -14,8 +15,38 @@ class Book(Base):
     serial_num: Mapped[str] = mapped_column(String(6), unique=True, index=True)  # indexing for future filtering option
     title: Mapped[str] = mapped_column(String, nullable=False, index=True)
     author: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    loans: Mapped[list["Loan"]] = relationship("Loan", back_populates="book", lazy="selectin")  # lazy loading would not work in async context
-    __table_args__ = (CheckConstraint("serial_num ~ '^[0-9]{6}$'", name="check_serial_num_six_digits"),)
+    # denormalized availability, set by checkout and cleared by return in the same transaction
+    current_loan_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("loans.id", name="fk_books_current_loan_id", ondelete="SET NULL", use_alter=True),
+        nullable=True,
+        default=None,
+    )
+    loans: Mapped[list["Loan"]] = relationship(
+        "Loan", back_populates="book", foreign_keys="Loan.book_id", lazy="selectin"
+    )  # lazy loading would not work in async context
+    __table_args__ = (
+        CheckConstraint("serial_num ~ '^[0-9]{6}$'", name="check_serial_num_six_digits"),
+        # partial index so available=true only scans books that are not on loan
+        Index("ix_books_available", "id", postgresql_where=text("current_loan_id IS NULL")),
+        # trigram index so the ilike '%author%' filter on available books can use it, requires pg_trgm
+        Index(
+            "ix_books_available_author_trgm",
+            "author",
+            postgresql_using="gin",
+            postgresql_ops={"author": "gin_trgm_ops"},
+            postgresql_where=text("current_loan_id IS NULL"),
+        ),
+    )
+
+    @hybrid_property
+    def is_available(self) -> bool:
+        return self.current_loan_id is None
+
+    @is_available.inplace.expression
+    @classmethod
+    def _is_available_expression(cls):
+        return cls.current_loan_id.is_(None)
 
 
 class Borrower(Base):
@@ -34,5 +65,5 @@ class Loan(Base):
     borrow_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.now)
     return_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
 
-    book: Mapped["Book"] = relationship("Book", back_populates="loans", lazy="selectin")
+    book: Mapped["Book"] = relationship("Book", back_populates="loans", foreign_keys=[book_id], lazy="selectin")
     borrower: Mapped["Borrower"] = relationship("Borrower", back_populates="loans", lazy="selectin")
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.db.models import Base
@@ -7,10 +8,56 @@ from app.db.models import Base
 async_engine = create_async_engine(url=os.getenv("DATABASE_URL"), pool_size=5, max_overflow=5)
 AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
+# create_all never alters existing tables, so databases created before availability tracking are upgraded here.
+AVAILABILITY_COLUMN_EXISTS = """
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = 'books' AND column_name = 'current_loan_id'
+"""
+
+# one-time upgrade, only run when the column is missing
+AVAILABILITY_COLUMN_MIGRATION = (
+    "ALTER TABLE books ADD COLUMN IF NOT EXISTS current_loan_id INTEGER",
+    # backfill books that are on loan but were lent before current_loan_id existed
+    """
+    UPDATE books SET current_loan_id = open_loans.id
+    FROM (
+        SELECT DISTINCT ON (book_id) id, book_id FROM loans
+        WHERE return_date IS NULL
+        ORDER BY book_id, borrow_date DESC
+    ) AS open_loans
+    WHERE open_loans.book_id = books.id
+    """,
+)
+
+# idempotent, safe to run on each startup
+AVAILABILITY_DDL = (
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_books_current_loan_id') THEN
+            ALTER TABLE books ADD CONSTRAINT fk_books_current_loan_id
+                FOREIGN KEY (current_loan_id) REFERENCES loans (id) ON DELETE SET NULL;
+        END IF;
+    END $$
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_books_available ON books (id) WHERE current_loan_id IS NULL",
+    """
+    CREATE INDEX IF NOT EXISTS ix_books_available_author_trgm
+        ON books USING gin (author gin_trgm_ops) WHERE current_loan_id IS NULL
+    """,
+)
+
 
 async def init_db():
     async with async_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))  # needed by ix_books_available_author_trgm
         await conn.run_sync(Base.metadata.create_all)
+        column_exists = (await conn.execute(text(AVAILABILITY_COLUMN_EXISTS))).scalar() is not None
+        if not column_exists:
+            for statement in AVAILABILITY_COLUMN_MIGRATION:
+                await conn.execute(text(statement))
+        for statement in AVAILABILITY_DDL:
+            await conn.execute(text(statement))
 
 
 async def get_db() -> AsyncSession:
@@ -1,11 +1,13 @@
 from contextlib import asynccontextmanager
 import logging
+import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.db.session import init_db
-from app.routers import books_router, borrowers_router, loans_router
+from app.routers import admin_router, books_router, borrowers_router, loans_router
+from app.utils.profiling import ProfilingMiddleware
 from app.utils.setup_logging import setup_logging
 
 setup_logging("library_api")
@@ -28,3 +30,15 @@ app.add_middleware(
 app.include_router(borrowers_router)
 app.include_router(books_router)
 app.include_router(loans_router)
+
+# opt-in request profiling, when disabled the middleware is not installed at all
+if os.getenv("PROFILING_ENABLED", "false").lower() == "true":
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+        token=os.getenv("PROFILING_TOKEN"),
+        max_profiles=int(os.getenv("PROFILING_MAX_FILES", "100")),
+    )
+    if os.getenv("PROFILING_TOKEN"):  # admin endpoints are only reachable with the token
+        app.include_router(admin_router)
+    logger.info("Request profiling enabled")
@@ -1,3 +1,4 @@
+from app.routers.admin import admin_router
 from app.routers.books import books_router
 from app.routers.borrowers import borrowers_router
 from app.routers.loans import loans_router
@@ -0,0 +1,45 @@
+import hmac
+import logging
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas import ProfileFilter, ProfileRead
+from app.utils.profiling import PROFILE_SUFFIX, get_profiles_dir, list_profiles
+
+logger = logging.getLogger(__name__)
+
+
+async def verify_profiling_token(x_profiling_token: str | None = Header(None)):
+    token = os.getenv("PROFILING_TOKEN")
+    if not token or not x_profiling_token or not hmac.compare_digest(x_profiling_token.encode(), token.encode()):
+        raise HTTPException(status_code=404, detail="Not Found")  # do not reveal that the admin endpoints exist
+
+
+admin_router = APIRouter(tags=["Admin"], prefix="/admin", dependencies=[Depends(verify_profiling_token)])
+
+
+@admin_router.get("/profiles", response_model=list[ProfileRead])
+async def list_profiles_endpoint(
+    filters: ProfileFilter = Depends(),
+):
+    logger.info("Listing request profiles with limit=%s", filters.limit)
+    try:
+        profiles = await run_in_threadpool(list_profiles, filters.limit)  # scandir and stat block
+    except Exception as e:
+        logger.error("Error listing profiles: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    logger.info("Listed %d profiles", len(profiles))
+    return profiles
+
+
+@admin_router.get("/profiles/{name}")
+async def get_profile_endpoint(name: str):
+    logger.info("Fetching profile %s", name)
+    path = os.path.join(get_profiles_dir(), name)
+    if os.path.basename(name) != name or not name.endswith(PROFILE_SUFFIX) or not os.path.isfile(path):
+        logger.warning("Profile not found: %s", name)
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=name)
@@ -1,11 +1,12 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.crud import create_book, delete_book, get_all_books, get_book, update_book
 from app.db.session import get_db
-from app.schemas import BookCreate, BookFilter, BookRead
+from app.schemas import AvailableBookFilter, BookCreate, BookFilter, BookRead, BookSummaryRead
 
 
 logger = logging.getLogger(__name__)
@@ -23,11 +24,40 @@ async def create_book_endpoint(
         db_book = await create_book(session, serial_num=book.serial_num, title=book.title, author=book.author)
         logger.info("Book created successfully with id=%s", db_book.id)
         return db_book
+    except IntegrityError:
+        logger.warning("Book with serial_num=%s already exists", book.serial_num)
+        raise HTTPException(status_code=409, detail="Book with this serial number already exists")
     except Exception as e:
         logger.error("Error creating book: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
+@books_router.get("/available", response_model=list[BookSummaryRead])
+async def get_available_books_endpoint(
+    filters: AvailableBookFilter = Depends(),
+    session: AsyncSession = Depends(get_db),
+):
+    logger.info(
+        "Fetching available books with filters: skip=%s, limit=%s, title=%s, author=%s",
+        filters.skip, filters.limit, filters.title, filters.author
+    )
+    try:
+        books = await get_all_books(
+            session,
+            skip=filters.skip,
+            limit=filters.limit,
+            title=filters.title,
+            author=filters.author,
+            available=True,
+            include_loans=False,
+        )
+    except Exception as e:
+        logger.error("Error fetching available books: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    logger.info("Fetched %d available books", len(books))
+    return books
+
+
 @books_router.get("/{book_id}", response_model=BookRead)
 async def get_book_endpoint(
     book_id: int,
@@ -52,8 +82,8 @@ async def get_all_books_endpoint(
     session: AsyncSession = Depends(get_db),
 ):
     logger.info(
-        "Fetching all books with filters: skip=%s, limit=%s, serial_num=%s, title=%s, author=%s",
-        filters.skip, filters.limit, filters.serial_num, filters.title, filters.author
+        "Fetching all books with filters: skip=%s, limit=%s, serial_num=%s, title=%s, author=%s, available=%s",
+        filters.skip, filters.limit, filters.serial_num, filters.title, filters.author, filters.available
     )
     try:
         books = await get_all_books(
@@ -63,6 +93,7 @@ async def get_all_books_endpoint(
             serial_num=filters.serial_num,
             title=filters.title,
             author=filters.author,
+            available=filters.available,
         )
         logger.info("Fetched %d books", len(books))
         return books
@@ -82,6 +113,9 @@ async def update_book_endpoint(
         db_book = await update_book(
             session, book_id=book_id, serial_num=book.serial_num, title=book.title, author=book.author
         )
+    except IntegrityError:
+        logger.warning("Book with serial_num=%s already exists", book.serial_num)
+        raise HTTPException(status_code=409, detail="Book with this serial number already exists")
     except Exception as e:
         logger.error("Error updating book: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -98,7 +132,14 @@ async def delete_book_endpoint(
     session: AsyncSession = Depends(get_db),
 ):
     logger.info("Deleting book with id=%s", book_id)
-    success = await delete_book(session, book_id)
+    try:
+        success = await delete_book(session, book_id)
+    except IntegrityError:
+        logger.warning("Book with id=%s has loans and cannot be deleted", book_id)
+        raise HTTPException(status_code=409, detail="Book has loans and cannot be deleted")
+    except Exception as e:
+        logger.error("Error deleting book: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal Server Error")
     if not success:
         logger.warning("Book not found for deletion: id=%s", book_id)
         raise HTTPException(status_code=404, detail="Book not found")
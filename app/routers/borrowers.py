@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.crud import create_borrower, delete_borrower, get_all_borrowers, get_borrower, update_borrower
@@ -23,6 +24,9 @@ async def create_borrower_endpoint(
         db_borrower = await create_borrower(session, borrower.card_number)
         logger.info("Borrower created successfully with id=%s", db_borrower.id)
         return db_borrower
+    except IntegrityError:
+        logger.warning("Borrower with card_number=%s already exists", borrower.card_number)
+        raise HTTPException(status_code=409, detail="Borrower with this card number already exists")
     except Exception as e:
         logger.error("Error creating borrower: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -78,6 +82,9 @@ async def update_borrower_endpoint(
     logger.info("Updating borrower id=%s with new card_number=%s", borrower_id, new_data.card_number)
     try:
         db_borrower = await update_borrower(session, borrower_id, new_card_number=new_data.card_number)
+    except IntegrityError:
+        logger.warning("Borrower with card_number=%s already exists", new_data.card_number)
+        raise HTTPException(status_code=409, detail="Borrower with this card number already exists")
     except Exception as e:
         logger.error("Error updating borrower: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -97,6 +104,9 @@ async def delete_borrower_endpoint(
     logger.info("Deleting borrower with id=%s", borrower_id)
     try:
         success = await delete_borrower(session, borrower_id)
+    except IntegrityError:
+        logger.warning("Borrower with id=%s has loans and cannot be deleted", borrower_id)
+        raise HTTPException(status_code=409, detail="Borrower has loans and cannot be deleted")
     except Exception as e:
         logger.error("Error deleting borrower: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -4,7 +4,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.crud import create_loan, delete_loan, get_all_loans, get_loan, update_loan_return_date
+from app.db.crud import BookUnavailableError, create_loan, delete_loan, get_all_loans, get_loan, update_loan_return_date
 from app.db.session import get_db
 from app.schemas import LoanCreate, LoanFilter, LoanRead
 
@@ -28,6 +28,9 @@ async def create_loan_endpoint(
         db_loan = await create_loan(session, loan.book_id, loan.borrower_id, loan.borrow_date)
         logger.info("Loan created successfully with id=%s", db_loan.id)
         return db_loan
+    except BookUnavailableError:
+        logger.warning("Book id=%s is already on loan", loan.book_id)
+        raise HTTPException(status_code=409, detail="Book is already on loan")
     except Exception as e:
         logger.error("Unexpected error creating loan: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -1,6 +1,7 @@
-from app.schemas.book import BookBase, BookCreate, BookFilter, BookRead
+from app.schemas.book import AvailableBookFilter, BookBase, BookCreate, BookFilter, BookRead, BookSummaryRead
 from app.schemas.borrower import BorrowerBase, BorrowerCreate, BorrowerFilter, BorrowerRead
 from app.schemas.loan import LoanBase, LoanCreate, LoanFilter, LoanRead
+from app.schemas.profile import ProfileFilter, ProfileRead
 
 BookRead.model_rebuild()
 BorrowerRead.model_rebuild()
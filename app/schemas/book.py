@@ -13,20 +13,35 @@ class BookCreate(BookBase):
     pass
 
 
-class BookRead(BookBase):
+class BookSummaryRead(BookBase):  # without loans, for listings that should not load loan history
     id: int
     serial_num: str
     title: str
     author: str
-    loans: Optional[list["LoanRead"]] = None
+    current_loan_id: Optional[int] = None
+    is_available: bool
 
     class Config:
         from_attributes = True
 
 
-class BookFilter(BaseModel):
+class BookRead(BookSummaryRead):
+    loans: Optional[list["LoanRead"]] = None
+
+
+class BookFilterBase(BaseModel):
     skip: Optional[int] = Field(None, ge=0, description="Number of records to skip for pagination")
     limit: Optional[int] = Field(None, gt=0, description="Maximum number of records to return")
-    serial_num: Optional[str] = Field(None, description="Filter by book serial number")
     title: Optional[str] = Field(None, description="Filter by book title")
     author: Optional[str] = Field(None, description="Filter by book author")
+
+
+class BookFilter(BookFilterBase):
+    serial_num: Optional[str] = Field(None, description="Filter by book serial number")
+    available: Optional[bool] = Field(
+        None, description="Filter by availability (true/false), use /books/available to skip loading loans"
+    )
+
+
+class AvailableBookFilter(BookFilterBase):
+    pass
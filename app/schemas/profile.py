@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileRead(BaseModel):
+    name: str
+    size_bytes: int
+    created_at: datetime
+
+
+class ProfileFilter(BaseModel):
+    limit: int = Field(20, gt=0, description="Maximum number of most recent profiles to return")
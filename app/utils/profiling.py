@@ -0,0 +1,108 @@
+import hmac
+import logging
+import os
+import random
+import re
+from datetime import datetime
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_SUFFIX = ".speedscope.json"
+
+
+def get_profiles_dir() -> str:
+    return os.path.join(os.getenv("LOG_DIR"), "profiles")
+
+
+def list_profiles(limit: int | None = None) -> list[dict]:
+    profiles_dir = get_profiles_dir()
+    if not os.path.isdir(profiles_dir):
+        return []
+    profiles = []
+    with os.scandir(profiles_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(PROFILE_SUFFIX):
+                stat = entry.stat()
+                profiles.append(
+                    {
+                        "name": entry.name,
+                        "size_bytes": stat.st_size,
+                        "created_at": datetime.fromtimestamp(stat.st_mtime),
+                    }
+                )
+    profiles.sort(key=lambda profile: profile["created_at"], reverse=True)  # most recent first
+    return profiles[:limit] if limit is not None else profiles
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that records a sampling profile of selected requests
+    and writes it to LOG_DIR/profiles in speedscope format.
+
+    A request is profiled when its X-Profile header matches the configured
+    token or when it is picked by sample_rate. Other requests are passed
+    straight through. Only the newest max_profiles files are kept.
+    """
+
+    def __init__(
+        self,
+        app,
+        sample_rate: float = 0.0,
+        token: str | None = None,
+        max_profiles: int = 100,
+        interval: float = 0.001,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.token = token.encode() if token else None  # header trigger is disabled without a token
+        self.max_profiles = max_profiles
+        self.interval = interval
+        self.profiles_dir = get_profiles_dir()
+        os.makedirs(self.profiles_dir, exist_ok=True)
+
+    def _should_profile(self, scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER and hmac.compare_digest(value, self.token):
+                    return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            # rendering takes tens of milliseconds, keep it off the event loop
+            await run_in_threadpool(self._write_profile, profiler, scope)
+
+    def _write_profile(self, profiler: Profiler, scope) -> None:
+        path = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+        filename = f"{datetime.now():%Y%m%dT%H%M%S%f}_{scope['method']}_{path}{PROFILE_SUFFIX}"
+        try:
+            with open(os.path.join(self.profiles_dir, filename), "w", encoding="utf-8") as file:
+                file.write(profiler.output(SpeedscopeRenderer()))
+        except Exception as e:  # profiling must never break the request
+            logger.error("Error writing profile %s: %s", filename, e, exc_info=True)
+            return
+        logger.info("Request profile written to %s", filename)
+        self._prune_profiles()
+
+    def _prune_profiles(self) -> None:
+        for profile in list_profiles()[self.max_profiles:]:
+            try:
+                os.remove(os.path.join(self.profiles_dir, profile["name"]))
+            except FileNotFoundError:  # already removed by a concurrent request
+                pass
+            except OSError as e:
+                logger.error("Error removing profile %s: %s", profile["name"], e, exc_info=True)